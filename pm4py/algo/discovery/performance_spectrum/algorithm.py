@@ -91,8 +91,10 @@ def apply(log: Union[EventLog, EventStream, pd.DataFrame], list_activities: List
         if variant is None:
             variant = Variants.LOG
 
-        points = exec_utils.get_variant(variant).apply(log_conversion.apply(log, variant=log_conversion.Variants.TO_EVENT_LOG, parameters=parameters), list_activities, sample_size,
-                                                            parameters)
+        if not isinstance(log, EventLog):
+            log = log_conversion.apply(log, variant=log_conversion.Variants.TO_EVENT_LOG, parameters=parameters)
+
+        points = exec_utils.get_variant(variant).apply(log, list_activities, sample_size, parameters)
 
     ps = {Outputs.LIST_ACTIVITIES.value: list_activities, Outputs.POINTS.value: points}
 
@@ -15,7 +15,12 @@
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
 
+import pkgutil
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
 from pm4py.objects.log.obj import EventLog, EventStream
+import numpy as np
 import pandas as pd
 from typing import Union, Optional, Dict, Any
 from pm4py.objects.conversion.log import converter as log_converter
@@ -23,6 +28,11 @@ from enum import Enum
 from pm4py.util import exec_utils, constants, xes_constants
 
 
+# anchored frequencies that pd.Grouper labels by the last day of the window
+_END_LABELED_OFFSETS = (pd.tseries.offsets.Week, pd.tseries.offsets.MonthEnd,
+                        pd.tseries.offsets.QuarterEnd, pd.tseries.offsets.YearEnd)
+
+
 class Parameters(Enum):
     ARRIVAL_RATE = "arrival_rate"
     FINISH_RATE = "finish_rate"
@@ -38,7 +48,279 @@ class Parameters(Enum):
     DIFF_START_END = "diff_start_end"
 
 
-def insert_arrival_finish_rate(log: pd.DataFrame, parameters: Dict[Any, Any]) -> pd.DataFrame:
+def _resolve_params(parameters):
+    """
+    Resolves all the parameters of the method once, so that the hot code
+    paths read plain attributes instead of repeatedly going through
+    exec_utils.get_param_value.
+
+    Parameters
+    -----------------
+    parameters
+        Parameters of the method
+
+    Returns
+    -----------------
+    resolved
+        Namespace with one attribute per parameter
+    """
+    resolved = SimpleNamespace()
+    resolved.grouper_freq = exec_utils.get_param_value(Parameters.GROUPER_FREQ, parameters, "W")
+    resolved.arrival_rate = exec_utils.get_param_value(Parameters.ARRIVAL_RATE, parameters, "@@arrival_rate")
+    resolved.finish_rate = exec_utils.get_param_value(Parameters.FINISH_RATE, parameters, "@@finish_rate")
+    resolved.case_id_column = exec_utils.get_param_value(Parameters.CASE_ID_COLUMN, parameters, constants.CASE_CONCEPT_NAME)
+    resolved.timestamp_column = exec_utils.get_param_value(Parameters.TIMESTAMP_COLUMN, parameters, xes_constants.DEFAULT_TIMESTAMP_KEY)
+    resolved.start_timestamp_column = exec_utils.get_param_value(Parameters.START_TIMESTAMP_COLUMN, parameters, None)
+    if resolved.start_timestamp_column is None:
+        resolved.start_timestamp_column = resolved.timestamp_column
+    resolved.resource_column = exec_utils.get_param_value(Parameters.RESOURCE_COLUMN, parameters, xes_constants.DEFAULT_RESOURCE_KEY)
+    resolved.activity_column = exec_utils.get_param_value(Parameters.ACTIVITY_COLUMN, parameters, xes_constants.DEFAULT_NAME_KEY)
+    resolved.diff_start_end = exec_utils.get_param_value(Parameters.DIFF_START_END, parameters, "@@diff_start_end")
+    resolved.service_time = exec_utils.get_param_value(Parameters.SERVICE_TIME, parameters, "@@service_time")
+    resolved.waiting_time = exec_utils.get_param_value(Parameters.WAITING_TIME, parameters, "@@waiting_time")
+    resolved.sojourn_time = exec_utils.get_param_value(Parameters.SOJOURN_TIME, parameters, "@@sojourn_time")
+    return resolved
+
+
+if pkgutil.find_loader("numba"):
+    from numba import njit, prange
+
+    @njit(cache=True)
+    def _diff_scatter(sorted_values, sorted_positions, out):
+        """
+        Scatters the consecutive differences of the sorted values into the
+        output array at the provided positions (0 for the first value).
+        """
+        out[sorted_positions[0]] = 0
+        for i in range(1, len(sorted_values)):
+            out[sorted_positions[i]] = sorted_values[i] - sorted_values[i - 1]
+        return out
+
+    @njit(cache=True, parallel=True)
+    def _sum_per_bin_kernel(starts, sorted_values, out):
+        """
+        Sums the rows of the sorted values matrix falling inside every bin,
+        parallelizing over the bins (the output rows are disjoint).
+        """
+        for w in prange(out.shape[0]):
+            for i in range(starts[w], starts[w + 1]):
+                for j in range(out.shape[1]):
+                    out[w, j] += sorted_values[i, j]
+        return out
+
+    def _sum_per_bin(bin_ids, values, num_bins):
+        """
+        Sums the rows of the values matrix per bin, returning a
+        (num_bins, num_columns) matrix of sums.
+        """
+        order = np.argsort(bin_ids, kind="stable")
+        starts = np.searchsorted(bin_ids[order], np.arange(num_bins + 1))
+        out = np.zeros((num_bins, values.shape[1]), dtype=np.float64)
+        return _sum_per_bin_kernel(starts, values[order], out)
+else:
+    def _diff_scatter(sorted_values, sorted_positions, out):
+        """
+        Scatters the consecutive differences of the sorted values into the
+        output array at the provided positions (0 for the first value).
+        """
+        out[sorted_positions] = np.concatenate(([0], np.diff(sorted_values)))
+        return out
+
+    def _sum_per_bin(bin_ids, values, num_bins):
+        """
+        Sums the rows of the values matrix per bin, returning a
+        (num_bins, num_columns) matrix of sums.
+        """
+        out = np.empty((num_bins, values.shape[1]), dtype=np.float64)
+        for j in range(values.shape[1]):
+            out[:, j] = np.bincount(bin_ids, weights=values[:, j], minlength=num_bins)
+        return out
+
+
+def _rate_per_case(timestamps, case_codes, case_index):
+    """
+    Computes, for every case, the difference in seconds between its
+    timestamp and the closest preceding timestamp of another case in
+    (timestamp, case) order (0 for the earliest case).
+
+    Parameters
+    -----------------
+    timestamps
+        Series with one timestamp per case
+    case_codes
+        Categorical codes of the cases, used as tie-break
+    case_index
+        Index for the returned series
+
+    Returns
+    -----------------
+    rates
+        Series with the rate of each case
+    """
+    values = timestamps.values.astype("datetime64[s]").astype(np.int64)
+    if len(values) == 0:
+        # no cases at all (e.g. the case id column only holds NaN): the
+        # njit kernel must not be entered with an empty array
+        return pd.Series(np.empty(0, dtype=np.int64), index=case_index)
+    order = np.lexsort((case_codes, values))
+    deltas = _diff_scatter(values[order], order, np.empty(len(values), dtype=np.int64))
+    return pd.Series(deltas, index=case_index)
+
+
+def _count_unique_per_bin(bin_ids, codes, num_bins):
+    """
+    Counts the number of distinct codes inside every bin through a single
+    np.unique pass over combined (bin, code) keys. Missing values, encoded
+    as negative codes, are excluded as nunique does.
+
+    Parameters
+    -----------------
+    bin_ids
+        NumPy array with the bin of each event
+    codes
+        NumPy array with the categorical code of each event
+    num_bins
+        Overall number of bins
+
+    Returns
+    -----------------
+    counts
+        NumPy array with the number of distinct codes per bin
+    """
+    num_codes = int(codes.max()) + 1 if len(codes) else 0
+    if num_codes <= 0:
+        return np.zeros(num_bins, dtype=np.int64)
+    mask = codes >= 0
+    keys = np.unique(bin_ids[mask].astype(np.int64) * num_codes + codes[mask])
+    return np.bincount(keys // num_codes, minlength=num_bins)
+
+
+def _get_time_bins(values, grouper_freq, tz=None):
+    """
+    Builds the window labels for the provided int64 nanosecond timestamps
+    and the given grouping frequency, reproducing the labeling of
+    pd.Grouper (left labels for tick frequencies such as D/H, end-of-period
+    labels for anchored frequencies such as W/M).
+
+    Parameters
+    -----------------
+    values
+        Int64 nanosecond timestamps of the events
+    grouper_freq
+        Grouping frequency (e.g., W)
+    tz
+        Timezone of the timestamp column, if any; for tick frequencies the
+        values are then UTC and the labels are returned tz-aware
+
+    Returns
+    -----------------
+    labels
+        DatetimeIndex with one label per window, from the window of the
+        first event to the window of the last event
+    """
+    offset = pd.tseries.frequencies.to_offset(grouper_freq)
+    day_ns = 24 * 3600 * 10**9
+    if isinstance(offset, (pd.tseries.offsets.Tick, pd.tseries.offsets.Day)):
+        step = offset.nanos if isinstance(offset, pd.tseries.offsets.Tick) else offset.n * day_ns
+        # pd.Grouper anchors the first window at the midnight of the day of
+        # the first event (origin="start_day")
+        if tz is not None and isinstance(offset, pd.tseries.offsets.Tick):
+            # tz-aware tick windows elapse in absolute time from the local
+            # start of day of the first event, converted back to UTC
+            local_midnight = pd.Timestamp(values.min(), unit="ns", tz="UTC").tz_convert(tz).normalize()
+            anchor = int(local_midnight.to_datetime64().astype("datetime64[ns]").astype(np.int64))
+        else:
+            anchor = (values.min() // day_ns) * day_ns
+        first = anchor + ((values.min() - anchor) // step) * step
+        num_bins = int((values.max() - first) // step) + 1
+        labels = pd.DatetimeIndex((first + step * np.arange(num_bins)).view("datetime64[ns]"))
+        if tz is not None and isinstance(offset, pd.tseries.offsets.Tick):
+            labels = labels.tz_localize("UTC").tz_convert(tz)
+    elif isinstance(offset, _END_LABELED_OFFSETS):
+        vmin = pd.Timestamp(values.min(), unit="ns").normalize()
+        vmax = pd.Timestamp(values.max(), unit="ns")
+        labels = pd.date_range(vmin, vmax + offset, freq=grouper_freq)
+        bin_ids = _assign_time_bins(values, labels, grouper_freq)
+        labels = labels[bin_ids.min():bin_ids.max() + 1]
+    else:
+        # offsets not modeled above (e.g. the start-anchored MS/YS) are
+        # delegated to pd.Grouper itself, which includes the empty windows
+        # between the first and the last event in its bins
+        sorted_index = pd.DatetimeIndex(np.sort(values).view("datetime64[ns]"))
+        sizes = pd.Series(0, index=sorted_index).groupby(pd.Grouper(freq=grouper_freq)).size()
+        labels = sizes.index
+    return labels
+
+
+def _assign_time_bins(values, labels, grouper_freq):
+    """
+    Assigns each of the provided int64 nanosecond timestamps to a window,
+    returning the positional indexes inside the labels.
+
+    Parameters
+    -----------------
+    values
+        Int64 nanosecond timestamps of the events
+    labels
+        DatetimeIndex with one label per window
+    grouper_freq
+        Grouping frequency (e.g., W)
+
+    Returns
+    -----------------
+    bin_ids
+        NumPy array with the index of the window of each event
+    """
+    offset = pd.tseries.frequencies.to_offset(grouper_freq)
+    day_ns = 24 * 3600 * 10**9
+    labels_i8 = labels.values.astype("datetime64[ns]").view(np.int64)
+    if isinstance(offset, (pd.tseries.offsets.Tick, pd.tseries.offsets.Day)):
+        step = offset.nanos if isinstance(offset, pd.tseries.offsets.Tick) else offset.n * day_ns
+        return (values - labels_i8[0]) // step
+    if isinstance(offset, _END_LABELED_OFFSETS):
+        # these anchored frequencies label the window by its last day: the
+        # window boundary is the start of the following day
+        edges = labels_i8 + day_ns
+        return np.searchsorted(edges, values, side="right")
+    # remaining offsets are delegated to pd.Grouper: the group numbers are
+    # positions inside its own bins (empty ones included), which are then
+    # aligned with the provided labels; the grouping happens on the sorted
+    # values, as ngroup misnumbers the bins of an unsorted datetime index
+    order = np.argsort(values, kind="stable")
+    grouped = pd.Series(0, index=pd.DatetimeIndex(values[order].view("datetime64[ns]"))).groupby(pd.Grouper(freq=grouper_freq))
+    sorted_ids = labels.get_indexer(grouped.size().index).take(grouped.ngroup().to_numpy())
+    bin_ids = np.empty(len(values), dtype=np.int64)
+    bin_ids[order] = sorted_ids
+    return bin_ids
+
+
+def _gather_per_case(values, categories, codes):
+    """
+    Gathers the per-case values onto the event rows through the categorical
+    codes of the case identifier; the rows with a missing case identifier
+    (code -1) receive NaN, as a mapping through the case identifier would.
+
+    Parameters
+    -----------------
+    values
+        Series with one value per case, indexed by the case identifier
+    categories
+        Categories of the case identifier column
+    codes
+        Categorical codes of the case identifier, one per event row
+
+    Returns
+    -----------------
+    gathered
+        Float32 array with one value per event row
+    """
+    per_case = values.reindex(categories).to_numpy(dtype=np.float32)
+    # NaN sentinel at the end, reached by the -1 code of missing case ids
+    per_case = np.append(per_case, np.float32(np.nan))
+    return per_case[codes]
+
+
+def insert_arrival_finish_rate(log: pd.DataFrame, parameters: Dict[Any, Any], resolved=None) -> pd.DataFrame:
     """
     Inserts the arrival/finish rate in the dataframe for the purpose of computing temporal features.
 
@@ -48,49 +330,34 @@ def insert_arrival_finish_rate(log: pd.DataFrame, parameters: Dict[Any, Any]) ->
         Pandas dataframe
     parameters
         Parameters of the method
+    resolved
+        Parameters already resolved by the caller (avoids re-resolution)
 
     Returns
     -----------------
     log
         Pandas dataframe enriched by arrival and finish rate
     """
-    arrival_rate = exec_utils.get_param_value(Parameters.ARRIVAL_RATE, parameters, "@@arrival_rate")
-    finish_rate = exec_utils.get_param_value(Parameters.FINISH_RATE, parameters, "@@finish_rate")
-    case_id_column = exec_utils.get_param_value(Parameters.CASE_ID_COLUMN, parameters, constants.CASE_CONCEPT_NAME)
-    timestamp_column = exec_utils.get_param_value(Parameters.TIMESTAMP_COLUMN, parameters, xes_constants.DEFAULT_TIMESTAMP_KEY)
-    start_timestamp_column = exec_utils.get_param_value(Parameters.START_TIMESTAMP_COLUMN, parameters, None)
-    if start_timestamp_column is None:
-        start_timestamp_column = timestamp_column
-
-    case_arrival = log.groupby(case_id_column)[start_timestamp_column].agg(min).to_dict()
-    case_arrival = [[x, y.timestamp()] for x, y in case_arrival.items()]
-    case_arrival.sort(key=lambda x: (x[1], x[0]))
-
-    case_finish = log.groupby(case_id_column)[timestamp_column].agg(max).to_dict()
-    case_finish = [[x, y.timestamp()] for x, y in case_finish.items()]
-    case_finish.sort(key=lambda x: (x[1], x[0]))
-
-    i = len(case_arrival) - 1
-    while i > 0:
-        case_arrival[i][1] = case_arrival[i][1] - case_arrival[i-1][1]
-        i = i - 1
-    case_arrival[0][1] = 0
-    case_arrival = {x[0]: x[1] for x in case_arrival}
-
-    i = len(case_finish) - 1
-    while i > 0:
-        case_finish[i][1] = case_finish[i][1] - case_finish[i-1][1]
-        i = i - 1
-    case_finish[0][1] = 0
-    case_finish = {x[0]: x[1] for x in case_finish}
-
-    log[arrival_rate] = log[case_id_column].map(case_arrival)
-    log[finish_rate] = log[case_id_column].map(case_finish)
+    p = resolved if resolved is not None else _resolve_params(parameters)
+    arrival_rate, finish_rate, case_id_column = p.arrival_rate, p.finish_rate, p.case_id_column
+
+    log[case_id_column] = log[case_id_column].astype("category")
+
+    case_agg = log.groupby(case_id_column).agg(arrival=(p.start_timestamp_column, "min"), finish=(p.timestamp_column, "max"))
+
+    case_codes = case_agg.index.codes
+    case_arrival = _rate_per_case(case_agg["arrival"], case_codes, case_agg.index)
+    case_finish = _rate_per_case(case_agg["finish"], case_codes, case_agg.index)
+
+    categories = log[case_id_column].cat.categories
+    codes = log[case_id_column].cat.codes.to_numpy()
+    log[arrival_rate] = _gather_per_case(case_arrival, categories, codes)
+    log[finish_rate] = _gather_per_case(case_finish, categories, codes)
 
     return log
 
 
-def insert_service_waiting_time(log: pd.DataFrame, parameters: Dict[Any, Any]) -> pd.DataFrame:
+def insert_service_waiting_time(log: pd.DataFrame, parameters: Dict[Any, Any], resolved=None, start_ns=None) -> pd.DataFrame:
     """
     Inserts the service/waiting/sojourn time in the dataframe for the purpose of computing temporal features.
 
@@ -100,31 +367,34 @@ def insert_service_waiting_time(log: pd.DataFrame, parameters: Dict[Any, Any]) -
         Pandas dataframe
     parameters
         Parameters of the method
+    resolved
+        Parameters already resolved by the caller (avoids re-resolution)
+    start_ns
+        Int64 nanosecond view of the start timestamp column, if already
+        computed by the caller
 
     Returns
     ----------------
     log
         Pandas dataframe with service, waiting and sojourn time
     """
-    timestamp_column = exec_utils.get_param_value(Parameters.TIMESTAMP_COLUMN, parameters, xes_constants.DEFAULT_TIMESTAMP_KEY)
-    start_timestamp_column = exec_utils.get_param_value(Parameters.START_TIMESTAMP_COLUMN, parameters, None)
-    if start_timestamp_column is None:
-        start_timestamp_column = timestamp_column
-    case_id_column = exec_utils.get_param_value(Parameters.CASE_ID_COLUMN, parameters, constants.CASE_CONCEPT_NAME)
-    diff_start_end = exec_utils.get_param_value(Parameters.DIFF_START_END, parameters, "@@diff_start_end")
-    service_time = exec_utils.get_param_value(Parameters.SERVICE_TIME, parameters, "@@service_time")
-    waiting_time = exec_utils.get_param_value(Parameters.WAITING_TIME, parameters, "@@waiting_time")
-    sojourn_time = exec_utils.get_param_value(Parameters.SOJOURN_TIME, parameters, "@@sojourn_time")
-
-    log[diff_start_end] = (log[timestamp_column] - log[start_timestamp_column]).astype("timedelta64[ms]")
-    service_times = log.groupby(case_id_column)[diff_start_end].sum().to_dict()
-    log[service_time] = log[case_id_column].map(service_times)
-
-    start_timestamps = log.groupby(case_id_column)[start_timestamp_column].agg(min).to_dict()
-    complete_timestamps = log.groupby(case_id_column)[timestamp_column].agg(max).to_dict()
-    sojourn_time_cases = {x: complete_timestamps[x].timestamp() - start_timestamps[x].timestamp() for x in start_timestamps}
-
-    log[sojourn_time] = log[case_id_column].map(sojourn_time_cases)
+    p = resolved if resolved is not None else _resolve_params(parameters)
+    case_id_column, service_time, waiting_time, sojourn_time = p.case_id_column, p.service_time, p.waiting_time, p.sojourn_time
+
+    log[case_id_column] = log[case_id_column].astype("category")
+
+    complete_ns = log[p.timestamp_column].to_numpy(dtype="datetime64[ns]").view(np.int64)
+    if start_ns is None:
+        start_ns = log[p.start_timestamp_column].to_numpy(dtype="datetime64[ns]").view(np.int64)
+    log[p.diff_start_end] = (complete_ns - start_ns) // 10**6
+
+    case_agg = log.groupby(case_id_column).agg(service=(p.diff_start_end, "sum"), arrival=(p.start_timestamp_column, "min"), finish=(p.timestamp_column, "max"))
+    sojourn_values = case_agg["finish"].values.astype("datetime64[s]").astype(np.int64) - case_agg["arrival"].values.astype("datetime64[s]").astype(np.int64)
+
+    categories = log[case_id_column].cat.categories
+    codes = log[case_id_column].cat.codes.to_numpy()
+    log[service_time] = _gather_per_case(case_agg["service"], categories, codes)
+    log[sojourn_time] = _gather_per_case(pd.Series(sojourn_values, index=case_agg.index), categories, codes)
     log[waiting_time] = log[sojourn_time] - log[service_time]
 
     return log
@@ -163,48 +433,76 @@ def apply(log: Union[EventLog, EventStream, pd.DataFrame], parameters: Optional[
     if parameters is None:
         parameters = {}
 
-    grouper_freq = exec_utils.get_param_value(Parameters.GROUPER_FREQ, parameters, "W")
-    timestamp_column = exec_utils.get_param_value(Parameters.TIMESTAMP_COLUMN, parameters, xes_constants.DEFAULT_TIMESTAMP_KEY)
-    start_timestamp_column = exec_utils.get_param_value(Parameters.START_TIMESTAMP_COLUMN, parameters, None)
-    if start_timestamp_column is None:
-        start_timestamp_column = timestamp_column
-    case_id_column = exec_utils.get_param_value(Parameters.CASE_ID_COLUMN, parameters, constants.CASE_CONCEPT_NAME)
-    arrival_rate = exec_utils.get_param_value(Parameters.ARRIVAL_RATE, parameters, "@@arrival_rate")
-    finish_rate = exec_utils.get_param_value(Parameters.FINISH_RATE, parameters, "@@finish_rate")
-    service_time = exec_utils.get_param_value(Parameters.SERVICE_TIME, parameters, "@@service_time")
-    waiting_time = exec_utils.get_param_value(Parameters.WAITING_TIME, parameters, "@@waiting_time")
-    sojourn_time = exec_utils.get_param_value(Parameters.SOJOURN_TIME, parameters, "@@sojourn_time")
-    resource_column = exec_utils.get_param_value(Parameters.RESOURCE_COLUMN, parameters, xes_constants.DEFAULT_RESOURCE_KEY)
-    activity_column = exec_utils.get_param_value(Parameters.ACTIVITY_COLUMN, parameters, xes_constants.DEFAULT_NAME_KEY)
-
-    log = log_converter.apply(log, variant=log_converter.Variants.TO_DATA_FRAME, parameters=parameters)
-    log = insert_arrival_finish_rate(log, parameters=parameters)
-    log = insert_service_waiting_time(log, parameters=parameters)
-
-    grouped_log = log.groupby(pd.Grouper(key=start_timestamp_column, freq=grouper_freq))
-
-    final_values = []
-
-    for gkey, gval in grouped_log:
-        dct = {}
-        dct["timestamp"] = gkey
-
-        gval_first = gval.groupby(case_id_column).first()
-
-        dct["unique_resources"] = gval[resource_column].nunique()
-        dct["unique_cases"] = gval[case_id_column].nunique()
-        dct["unique_activities"] = gval[activity_column].nunique()
-        dct["num_events"] = len(gval)
-
-        dct["average_arrival_rate"] = gval_first[arrival_rate].mean()
-        dct["average_finish_rate"] = gval_first[finish_rate].mean()
-
-        dct["average_waiting_time"] = gval_first[waiting_time].mean()
-        dct["average_sojourn_time"] = gval_first[sojourn_time].mean()
-        dct["average_service_time"] = gval_first[service_time].mean()
-
-        final_values.append(dct)
-
-    dataframe = pd.DataFrame(final_values)
-    dataframe.fillna(0, inplace=True)
-    return dataframe
+    p = _resolve_params(parameters)
+    grouper_freq, case_id_column, start_timestamp_column = p.grouper_freq, p.case_id_column, p.start_timestamp_column
+
+    if not isinstance(log, pd.DataFrame):
+        log = log_converter.apply(log, variant=log_converter.Variants.TO_DATA_FRAME, parameters=parameters)
+    log[case_id_column] = log[case_id_column].astype("category")
+
+    if len(log) == 0:
+        return pd.DataFrame()
+
+    # the rate and the service/waiting time enrichments read the same
+    # column subset but are otherwise independent and write disjoint
+    # columns: run them concurrently on their own column slices
+    start_values = log[start_timestamp_column].to_numpy(dtype="datetime64[ns]").view(np.int64)
+
+    time_columns = list(dict.fromkeys([case_id_column, start_timestamp_column, p.timestamp_column]))
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        rates_future = executor.submit(insert_arrival_finish_rate, log[time_columns].copy(), parameters, p)
+        times_future = executor.submit(insert_service_waiting_time, log[time_columns].copy(), parameters, p, start_values)
+        rates, times = rates_future.result(), times_future.result()
+    log[p.arrival_rate] = rates[p.arrival_rate]
+    log[p.finish_rate] = rates[p.finish_rate]
+    log[p.diff_start_end] = times[p.diff_start_end]
+    log[p.service_time] = times[p.service_time]
+    log[p.sojourn_time] = times[p.sojourn_time]
+    log[p.waiting_time] = times[p.waiting_time]
+
+    # pd.Grouper windows tz-aware timestamps by their wall-clock time for
+    # the calendar frequencies, but by absolute elapsed time for the tick
+    # frequencies: the former bin on the tz-stripped values (localizing the
+    # labels back afterwards), the latter on the UTC values directly
+    tz = getattr(log[start_timestamp_column].dtype, "tz", None)
+    tick_freq = isinstance(pd.tseries.frequencies.to_offset(grouper_freq), pd.tseries.offsets.Tick)
+    if tz is not None and not tick_freq:
+        bin_values = log[start_timestamp_column].dt.tz_localize(None).to_numpy(dtype="datetime64[ns]").view(np.int64)
+    else:
+        bin_values = start_values
+
+    window_labels = _get_time_bins(bin_values, grouper_freq, tz)
+    bin_ids = _assign_time_bins(bin_values, window_labels, grouper_freq)
+
+    num_windows = len(window_labels)
+
+    resource_codes = log[p.resource_column].astype("category").cat.codes.to_numpy()
+    activity_codes = log[p.activity_column].astype("category").cat.codes.to_numpy()
+    case_codes = log[case_id_column].cat.codes.to_numpy()
+
+    first_by_case = log.sort_values(start_timestamp_column).groupby(case_id_column, observed=True, as_index=False).first()
+    first_start = first_by_case[start_timestamp_column]
+    if tz is not None and not tick_freq:
+        first_start = first_start.dt.tz_localize(None)
+    first_bin_ids = _assign_time_bins(first_start.to_numpy(dtype="datetime64[ns]").view(np.int64), window_labels, grouper_freq)
+
+    if tz is not None and window_labels.tz is None:
+        window_labels = window_labels.tz_localize(tz, ambiguous=True, nonexistent="shift_forward")
+
+    # per-window means as streamed sums over preallocated arrays; windows
+    # without cases keep the 0 previously produced by fillna
+    first_counts = np.bincount(first_bin_ids, minlength=num_windows)
+    columns = {"timestamp": window_labels,
+               "unique_resources": _count_unique_per_bin(bin_ids, resource_codes, num_windows),
+               "unique_cases": _count_unique_per_bin(bin_ids, case_codes, num_windows),
+               "unique_activities": _count_unique_per_bin(bin_ids, activity_codes, num_windows),
+               "num_events": np.bincount(bin_ids, minlength=num_windows)}
+    first_values = first_by_case[[p.arrival_rate, p.finish_rate, p.waiting_time, p.sojourn_time, p.service_time]].to_numpy(dtype=np.float64)
+    sums = _sum_per_bin(first_bin_ids, first_values, num_windows)
+    means = np.zeros_like(sums)
+    np.divide(sums, first_counts[:, None], out=means, where=first_counts[:, None] > 0)
+    for j, feature in enumerate(["average_arrival_rate", "average_finish_rate", "average_waiting_time",
+                                 "average_sojourn_time", "average_service_time"]):
+        columns[feature] = means[:, j]
+
+    return pd.DataFrame(columns)
@@ -41,6 +41,7 @@ if __name__ == "__main__":
     from tests.ocel_filtering_test import OcelFilteringTest
     from tests.ocel_discovery_test import OcelDiscoveryTest
     from tests.simulation_test import SimulationTest
+    from tests.temporal_features_test import TemporalFeaturesTest
 
     ocel_filtering_test = OcelFilteringTest()
     ocel_discovery_test = OcelDiscoveryTest()
@@ -76,5 +77,6 @@ if __name__ == "__main__":
     diagn_dataframe_test = DiagnDfConfChecking()
     simplified_test = SimplifiedInterfaceTest()
     simulation_test = SimulationTest()
+    temporal_features_test = TemporalFeaturesTest()
 
     unittest.main()
@@ -0,0 +1,74 @@
+import os
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from pm4py.algo.transformation.log_to_features.variants import temporal
+from tests.constants import INPUT_DATA_DIR
+
+
+def build_small_dataframe():
+    dataframe = pd.DataFrame({
+        "case:concept:name": ["a", "b", "a", None, "c"],
+        "concept:name": ["A", "B", "C", "D", "E"],
+        "org:resource": ["r1", "r2", "r1", "r3", "r1"],
+        "start_timestamp": pd.to_datetime(["2021-01-01 01:00", "2021-01-01 02:00", "2021-01-01 03:00",
+                                           "2021-01-02 05:00", "2021-01-02 10:00"]),
+        "time:timestamp": pd.to_datetime(["2021-01-01 01:30", "2021-01-01 02:10", "2021-01-01 04:00",
+                                          "2021-01-02 05:05", "2021-01-02 10:20"]),
+    })
+    return dataframe
+
+
+class TemporalFeaturesTest(unittest.TestCase):
+    def test_num_events_match_grouper(self):
+        # to avoid static method warnings in tests,
+        # that by construction of the unittest package have to be expressed in such way
+        self.dummy_variable = "dummy_value"
+        dataframe = pd.read_csv(os.path.join(INPUT_DATA_DIR, "receipt.csv"))
+        dataframe["time:timestamp"] = pd.to_datetime(dataframe["time:timestamp"], utc=True)
+        for freq in ["D", "2D", "MS", "W", "ME", "12h"]:
+            features = temporal.apply(dataframe.copy(), parameters={temporal.Parameters.GROUPER_FREQ: freq})
+            expected = dataframe.groupby(pd.Grouper(key="time:timestamp", freq=freq)).size()
+            self.assertEqual(len(features), len(expected))
+            self.assertTrue((features["num_events"].to_numpy() == expected.to_numpy()).all())
+            self.assertTrue((pd.to_datetime(features["timestamp"]).to_numpy() == expected.index.to_numpy()).all())
+
+    def test_metric_columns(self):
+        # to avoid static method warnings in tests,
+        # that by construction of the unittest package have to be expressed in such way
+        self.dummy_variable = "dummy_value"
+        dataframe = build_small_dataframe()
+        features = temporal.apply(dataframe, parameters={temporal.Parameters.GROUPER_FREQ: "D",
+                                                         temporal.Parameters.START_TIMESTAMP_COLUMN: "start_timestamp"})
+        self.assertEqual(len(features), 2)
+        self.assertEqual(features["num_events"].tolist(), [3, 2])
+        self.assertEqual(features["unique_cases"].tolist(), [2, 1])
+        self.assertEqual(features["unique_resources"].tolist(), [2, 2])
+        self.assertEqual(features["unique_activities"].tolist(), [3, 2])
+        # day 1 averages over the first events of a and b, day 2 only over c
+        # (the NaN-case event counts in num_events but belongs to no case)
+        self.assertEqual(features["average_arrival_rate"].tolist(), [(0 + 3600) / 2, 115200])
+        self.assertEqual(features["average_finish_rate"].tolist(), [(6600 + 0) / 2, 109200])
+        self.assertEqual(features["average_service_time"].tolist(), [(5400000 + 600000) / 2, 1200000])
+        self.assertEqual(features["average_sojourn_time"].tolist(), [(10800 + 600) / 2, 1200])
+        self.assertEqual(features["average_waiting_time"].tolist(), [(-5389200 - 599400) / 2, -1198800])
+
+    def test_missing_case_rows_get_nan(self):
+        # to avoid static method warnings in tests,
+        # that by construction of the unittest package have to be expressed in such way
+        self.dummy_variable = "dummy_value"
+        dataframe = build_small_dataframe()
+        parameters = {temporal.Parameters.START_TIMESTAMP_COLUMN: "start_timestamp"}
+        rates = temporal.insert_arrival_finish_rate(dataframe.copy(), parameters=parameters)
+        times = temporal.insert_service_waiting_time(dataframe.copy(), parameters=parameters)
+        for column, frame in [("@@arrival_rate", rates), ("@@finish_rate", rates), ("@@service_time", times),
+                              ("@@sojourn_time", times), ("@@waiting_time", times)]:
+            values = frame[column].to_numpy(dtype=float)
+            self.assertTrue(np.isnan(values[3]))
+            self.assertFalse(np.isnan(values[[0, 1, 2, 4]]).any())
+
+
+if __name__ == "__main__":
+    unittest.main()